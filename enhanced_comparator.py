@@ -1,13 +1,14 @@
 """
 Enhanced E-Commerce Product Comparator with Advanced Features
 """
-import requests
 import pandas as pd
-import numpy as np
-from typing import List, Dict, Any
-import json
+from typing import Dict, Any
 import re
-from main import EcomProductComparator
+from concurrent.futures import ThreadPoolExecutor
+from main import EcomProductComparator, _PRICE_PATTERNS, _has_currency_marker
+
+# Fallback for prices without commas: ₹ followed by 4+ digits
+_SIMPLE_PRICE_RE = re.compile(r'[₹$€£]\s*\d{4,}(?:\.\d+)?')
 
 class EnhancedEcomComparator(EcomProductComparator):
     def __init__(self, serpapi_key: str):
@@ -24,15 +25,18 @@ class EnhancedEcomComparator(EcomProductComparator):
         """Compare products across all e-commerce sites with enhanced features"""
         print(f"Searching for '{query}' on all e-commerce sites...")
         
-        # Fetch products from all sites
+        # Fetch products from all sites concurrently
         all_products = []
-        for site_key in self.sites.keys():
-            products = self.fetch_products(query, site_key, num_products)
+        site_keys = list(self.sites.keys())
+        with ThreadPoolExecutor(max_workers=len(site_keys) or 1) as executor:
+            results = executor.map(lambda site_key: self.fetch_products(query, site_key, num_products), site_keys)
+        for site_key, products in zip(site_keys, results):
+            site_name = self.sites[site_key]
             for product in products:
-                all_products.append(self.extract_product_info(product, site_key))
+                all_products.append(self.extract_product_info(product, site_name))
         
         # Create DataFrame
-        df = pd.DataFrame(all_products)
+        df = self._build_dataframe(all_products)
         
         if df.empty:
             print("No products found!")
@@ -43,97 +47,19 @@ class EnhancedEcomComparator(EcomProductComparator):
         
         return df
     
-    def extract_product_info(self, product: Dict[Any, Any], site: str) -> Dict[str, Any]:
-        """Extract relevant information from a product with enhanced data extraction"""
-        # Extract price and convert to numeric
-        price_str = product.get("price", "0")
-        
-        # If price is not directly available, try to find it in other fields
-        if not price_str or price_str == "0":
-            # Check if there's price information in the snippet or other fields
-            snippet = product.get("snippet", "")
-            price_str = self._extract_price_from_text(snippet)
-            
-            # If still no price found, check the title
-            if price_str == "0":
-                title = product.get("title", "")
-                price_str = self._extract_price_from_text(title)
-        
-        price = self._extract_price(price_str)
-        
-        # Extract rating and reviews from rich_snippet if available
-        rating = product.get("rating", 0)
-        reviews = product.get("reviews", 0)
-        
-        # Check rich_snippet for rating/reviews if not directly available
-        rich_snippet = product.get("rich_snippet", {})
-        if rich_snippet:
-            top = rich_snippet.get("top", {})
-            detected_extensions = top.get("detected_extensions", {})
-            if not rating and "rating" in detected_extensions:
-                rating = detected_extensions.get("rating", 0)
-            if not reviews and "reviews" in detected_extensions:
-                reviews = detected_extensions.get("reviews", 0)
-        
-        # If we still don't have rating/reviews, try to extract from snippet
-        if not rating or not reviews:
-            snippet = product.get("snippet", "")
-            if not rating:
-                rating = self._extract_rating_from_text(snippet)
-            if not reviews:
-                reviews = self._extract_reviews_from_text(snippet)
-        
-        # Extract image URL if available
-        image_url = product.get("thumbnail", "") or product.get("image", "")
-        
-        return {
-            "name": product.get("title", ""),
-            "price": price,
-            "rating": rating,
-            "reviews": reviews,
-            "link": product.get("link", ""),
-            "site": self.sites.get(site, site),
-            "raw_price": price_str,
-            "image_url": image_url
-        }
-    
     def _extract_price_from_text(self, text: str) -> str:
         """Extract price from text using regex patterns with enhanced logic"""
-        if not text:
+        # Most snippets and titles have no price, so skip the regexes when there is no currency marker
+        if not text or not _has_currency_marker(text):
             return "0"
         
-        # Look for price patterns in the text
-        patterns = [
-            r'[₹$€£]\s*\d+(?:,\d+)+(?:\.\d+)?',  # ₹ 60,000.00 or $ 1,299.99 (requires comma)
-            r'[₹$€£]\d+(?:,\d+)+(?:\.\d+)?',     # ₹60,000.00 or $1,299.99 (requires comma)
-            r'INR\s*\d+(?:,\d+)+(?:\.\d+)?',     # INR 60,000.00 (requires comma)
-            r'Rs\.\s*\d+(?:,\d+)+(?:\.\d+)?',    # Rs. 60,000.00 (requires comma)
-        ]
-        
-        # Try patterns that require commas (more likely to be actual prices)
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Return the first match that looks like a reasonable product price
-                for match in matches:
-                    price_value = self._extract_price(match)
-                    if price_value >= 1000:  # Lower threshold for more products
-                        return match
-        
-        # If no comma-based prices found, try simpler patterns but be more selective
-        simple_patterns = [
-            r'[₹$€£]\s*\d{4,}(?:\.\d+)?',       # ₹ followed by 4+ digits
-            r'[₹$€£]\d{4,}(?:\.\d+)?',          # ₹ followed by 4+ digits
-        ]
-        
-        for pattern in simple_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Return the first match that looks like a reasonable product price
-                for match in matches:
-                    price_value = self._extract_price(match)
-                    if price_value >= 1000:  # Lower threshold for more products
-                        return match
+        # Try prices with commas first, then the simpler pattern
+        for pattern in (*_PRICE_PATTERNS, _SIMPLE_PRICE_RE):
+            # Return the first match that looks like a reasonable product price
+            for match in pattern.finditer(text):
+                price_value = self._extract_price(match.group())
+                if price_value >= 1000:  # Lower threshold for more products
+                    return match.group()
         
         return "0"
     
@@ -142,19 +68,19 @@ class EnhancedEcomComparator(EcomProductComparator):
         if df.empty:
             return {}
             
-        # Get product with highest score
-        best_product = df.loc[df["final_score"].idxmax()]
+        # Get position of product with highest score
+        best = int(df["final_score"].to_numpy().argmax())
         
         return {
-            "name": best_product["name"],
-            "site": best_product["site"],
-            "price": best_product["price"],
-            "raw_price": best_product["raw_price"],
-            "rating": best_product["rating"],
-            "reviews": best_product["reviews"],
-            "link": best_product["link"],
-            "score": best_product["final_score"],
-            "image_url": best_product.get("image_url", "")
+            "name": df["name"].iat[best],
+            "site": df["site"].iat[best],
+            "price": df["price"].iat[best],
+            "raw_price": df["raw_price"].iat[best],
+            "rating": df["rating"].iat[best],
+            "reviews": df["reviews"].iat[best],
+            "link": df["link"].iat[best],
+            "score": df["final_score"].iat[best],
+            "image_url": df["image_url"].iat[best] if "image_url" in df else ""
         }
 
 def main():
@@ -1,15 +1,125 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
-import time
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Optional, NamedTuple
+import orjson
 import re
+import os
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# (connect, read) timeout in seconds for SerpAPI requests
+REQUEST_TIMEOUT = (3, 10)
+
+# How long (in seconds) fetched search results are reused before querying SerpAPI again
+CACHE_TTL = 3600
+_MAX_CACHED_SEARCHES = 256
+
+# Most product comparisons a caller should run at once; each one fetches every site
+# in its own thread, so this bounds the concurrent SerpAPI requests
+MAX_PARALLEL_COMPARISONS = 8
+# Number of entries in the comparators' sites tables
+_MAX_SITES = 4
+
+# One session shared by every comparator so SerpAPI connections stay warm across
+# comparator instances (the Streamlit apps create a new one on every rerun).
+# All requests go to serpapi.com, so a single host pool is enough, sized to keep one
+# connection per in-flight request. Only failed connects are retried; a read timeout
+# fails fast per REQUEST_TIMEOUT
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_COMPARISONS * _MAX_SITES,
+                                       max_retries=Retry(connect=2, read=0, backoff_factor=0.3)))
+# SerpAPI JSON compresses well, so always ask for a compressed response
+_SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+# In-process cache of search results: (query, site, num_results) -> (fetched_at, products)
+_search_cache: Dict[tuple, tuple] = {}
+_search_cache_lock = threading.Lock()
+
+# Amount with thousands separators: 1-3 leading digits, then comma groups of
+# 2-3 digits (covers 60,000 and 1,19,900) and up to 2 decimal places.
+# Bounded group widths keep backtracking on long digit runs linear.
+_PRICE_AMOUNT = r'\d{1,3}(?:,\d{2,3})+(?!\d)(?:\.\d{1,2})?'
+
+# Prices that require a comma (more likely to be actual prices), ordered by how
+# common the currency is on the supported sites: ₹ 60,000.00, then $1,299.99,
+# then INR 60,000.00 or Rs. 60,000.00
+_PRICE_PATTERNS = (
+    re.compile(r'₹\s*' + _PRICE_AMOUNT),
+    re.compile(r'[$€£]\s*' + _PRICE_AMOUNT),
+    re.compile(r'(?:INR|Rs\.)\s*' + _PRICE_AMOUNT),
+)
+
+# Fallback for prices without commas: ₹ followed by 5+ digits
+_SIMPLE_PRICE_RE = re.compile(r'[₹$€£]\s*\d{5,}(?:\.\d+)?')
+
+def _has_currency_marker(text: str) -> bool:
+    """Check whether text contains any currency marker the price patterns start with"""
+    return '₹' in text or '$' in text or '€' in text or '£' in text or 'INR' in text or 'Rs.' in text
+
+def _currency_priority(price_text: str) -> int:
+    """Index of the _PRICE_PATTERNS tier a matched price belongs to"""
+    if price_text.startswith('₹'):
+        return 0
+    if price_text[0] in '$€£':
+        return 1
+    return 2
+
+# Bare decimal number, the last-resort rating like "4.5"
+_DECIMAL_NUMBER = re.compile(r'\b(\d+\.\d+)\b')
+
+# Strips the thousands separators from a matched review count
+_NON_DIGIT = re.compile(r'[^\d]')
+
+# Comma-separated price, labelled rating and review count as one alternation,
+# so a snippet only has to be scanned once for all three fields
+_SNIPPET_FIELDS_RE = re.compile(
+    r'(?P<price>(?:[₹$€£]\s*|INR\s*|Rs\.\s*)' + _PRICE_AMOUNT + r')'
+    r'|(?P<rating>\d+\.\d+)\s*(?i:stars?|★|rating|out of 5)'
+    r'|(?i:Rating):\s*(?P<labelled_rating>\d+\.\d+)'
+    r'|(?P<reviews>\d+(?:,\d+)*)\s*(?i:reviews?|ratings?)'
+)
+
+class _PriceChars(dict):
+    """str.translate table that keeps digits, '.' and ',' and deletes everything else.
+
+    Entries are filled in on first sight so any currency symbol is handled
+    without listing them up front.
+    """
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isdecimal() or char in '.,' else None
+        return self[codepoint]
+
+_PRICE_CHARS = _PriceChars()
+
+# Converts "1.234,56" to "1234.56" (dot as thousand separator, comma as decimal separator)
+_COMMA_DECIMAL_TABLE = str.maketrans({'.': None, ',': '.'})
+
+class ProductInfo(NamedTuple):
+    """Fixed-schema product record, cheaper to build than a dict per product"""
+    name: str
+    price: float
+    rating: float
+    reviews: int
+    link: str
+    site: str
+    raw_price: str
+    image_url: str
 
 class EcomProductComparator:
     def __init__(self, serpapi_key: str):
         self.serpapi_key = serpapi_key
         self.base_url = "https://serpapi.com/search.json"
+        self.session = _SESSION
+        # Search results are also cached on disk so they survive restarts. The cache lives
+        # in the user's own cache directory, not a shared path other users could plant files in
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        self.cache_dir = os.path.join(cache_home, "price-com", "serpapi")
         # Include more e-commerce sites
         self.sites = {
             "amazon.in": "Amazon India",
@@ -20,43 +130,97 @@ class EcomProductComparator:
         
     def fetch_products(self, query: str, site: str, num_results: int = 5) -> List[Dict[Any, Any]]:
         """Fetch products from a specific site using SerpAPI"""
+        # Searches differing only in case or spacing share one cache entry
+        cache_key = (" ".join(query.lower().split()), site, num_results)
+        cached_products = self._get_cached_products(cache_key)
+        if cached_products is not None:
+            return list(cached_products)
+        
         # Improve search query to get better results with pricing information
         search_query = f"{query} price site:{site}"
         params = {
             "engine": "google",
             "q": search_query,
-            "api_key": self.serpapi_key
+            "api_key": self.serpapi_key,
+            # Only ask for as many results as we use to keep the response small
+            "num": num_results
         }
         
         try:
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            response = self.session.get(self.base_url, params=params, timeout=REQUEST_TIMEOUT)
+            if response.status_code >= 400:
+                print(f"Error fetching products from {site}: HTTP {response.status_code}")
+                return []
+            data = orjson.loads(response.content)
             
-            # Extract organic results (products)
+            # Extract organic results (products), SerpAPI may still return more than requested
             products = data.get("organic_results", [])[:num_results]
+            self._cache_products(cache_key, products)
             return products
+        except (requests.Timeout, requests.ConnectionError) as e:
+            # Give up on this site quickly rather than stalling the whole comparison
+            print(f"SerpAPI request for {site} timed out or could not connect: {e}")
+            return []
         except Exception as e:
             print(f"Error fetching products from {site}: {e}")
             return []
     
-    def extract_product_info(self, product: Dict[Any, Any], site: str) -> Dict[str, Any]:
-        """Extract relevant information from a product"""
-        # Extract price and convert to numeric
-        price_str = product.get("price", "0")
+    def _cache_path(self, cache_key: tuple) -> str:
+        """Get the on-disk cache file for a search"""
+        digest = hashlib.sha1(orjson.dumps(cache_key)).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def _get_cached_products(self, cache_key: tuple) -> Optional[List[Dict[Any, Any]]]:
+        """Get cached search results if they are younger than CACHE_TTL"""
+        with _search_cache_lock:
+            entry = _search_cache.get(cache_key)
+        if entry and time.time() - entry[0] < CACHE_TTL:
+            return entry[1]
+        
+        # Fall back to the on-disk cache
+        try:
+            with open(self._cache_path(cache_key), "rb") as f:
+                entry = orjson.loads(f.read())
+            fetched_at, products = entry["fetched_at"], entry["products"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if time.time() - fetched_at >= CACHE_TTL:
+            return None
+        
+        with _search_cache_lock:
+            _search_cache[cache_key] = (fetched_at, products)
+        return products
+    
+    def _cache_products(self, cache_key: tuple, products: List[Dict[Any, Any]]):
+        """Store search results in the in-process and on-disk caches"""
+        fetched_at = time.time()
+        with _search_cache_lock:
+            # Evict the oldest search once the cache is full
+            if cache_key not in _search_cache and len(_search_cache) >= _MAX_CACHED_SEARCHES:
+                del _search_cache[next(iter(_search_cache))]
+            _search_cache[cache_key] = (fetched_at, products)
         
-        # If price is not directly available, try to find it in other fields
-        if not price_str or price_str == "0":
-            # Check if there's price information in the snippet or other fields
-            snippet = product.get("snippet", "")
-            price_str = self._extract_price_from_text(snippet)
-            
-            # If still no price found, check the title
-            if price_str == "0":
-                title = product.get("title", "")
-                price_str = self._extract_price_from_text(title)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            path = self._cache_path(cache_key)
+            # Write to a temporary file first so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps({"fetched_at": fetched_at, "products": products}))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error writing search cache: {e}")
+    
+    def extract_product_info(self, product: Dict[Any, Any], site_name: str) -> ProductInfo:
+        """Extract relevant information from a product listed on the site with the given display name"""
+        price_str = product.get("price", "0")
         
-        price = self._extract_price(price_str)
+        # Use the numeric price SerpAPI has already parsed when available
+        price = product.get("extracted_price")
+        has_price = isinstance(price, (int, float)) and not isinstance(price, bool) and price > 0
+        if has_price and (not price_str or price_str == "0"):
+            # The currency isn't known here, so show just the amount, keeping any fraction
+            price_str = f"{price:,.0f}" if price == int(price) else f"{price:,.2f}"
         
         # Extract rating and reviews from rich_snippet if available
         rating = product.get("rating", 0)
@@ -72,127 +236,103 @@ class EcomProductComparator:
             if not reviews and "reviews" in detected_extensions:
                 reviews = detected_extensions.get("reviews", 0)
         
-        # If we still don't have rating/reviews, try to extract from snippet
-        if not rating or not reviews:
-            snippet = product.get("snippet", "")
+        # If price, rating or reviews are still missing, try to extract them from the snippet
+        missing_price = not has_price and (not price_str or price_str == "0")
+        if missing_price or not rating or not reviews:
+            snippet_price, snippet_rating, snippet_reviews = self._extract_snippet_fields(
+                product.get("snippet", ""), need_price=missing_price, need_rating=not rating, need_reviews=not reviews)
+            if missing_price:
+                price_str = snippet_price
+                
+                # If still no price found, check the title
+                if price_str == "0":
+                    title = product.get("title", "")
+                    price_str = self._extract_price_from_text(title)
             if not rating:
-                rating = self._extract_rating_from_text(snippet)
+                rating = snippet_rating
             if not reviews:
-                reviews = self._extract_reviews_from_text(snippet)
+                reviews = snippet_reviews
+        
+        price = float(price) if has_price else self._extract_price(price_str)
         
         # Extract image URL if available
         image_url = product.get("thumbnail", "") or product.get("image", "")
         
-        return {
-            "name": product.get("title", ""),
-            "price": price,
-            "rating": rating,
-            "reviews": reviews,
-            "link": product.get("link", ""),
-            "site": self.sites.get(site, site),
-            "raw_price": price_str,
-            "image_url": image_url
-        }
+        return ProductInfo(
+            name=product.get("title", ""),
+            price=price,
+            rating=rating,
+            reviews=reviews,
+            link=product.get("link", ""),
+            site=site_name,
+            raw_price=price_str,
+            image_url=image_url
+        )
+    
+    def _extract_snippet_fields(self, text: str, need_price: bool = True, need_rating: bool = True,
+                                need_reviews: bool = True) -> tuple:
+        """Extract price, rating and number of reviews from text in a single regex pass.
+        
+        Fields the caller already has are skipped, and left at their zero value.
+        """
+        price_str, rating, reviews = "0", 0.0, 0
+        if not text:
+            return price_str, rating, reviews
+        
+        # Price matches are still consumed when the price isn't needed, so their digits
+        # are never read as a review count
+        price_priority = len(_PRICE_PATTERNS) if need_price else 0
+        for match in _SNIPPET_FIELDS_RE.finditer(text):
+            field = match.lastgroup
+            value = match.group(field)
+            if field == "price":
+                # Keep the first reasonable product price in the most common currency
+                priority = _currency_priority(value)
+                if priority < price_priority and self._extract_price(value) >= 1000:
+                    price_str, price_priority = value, priority
+            elif field == "reviews":
+                if need_reviews and not reviews:
+                    reviews = int(_NON_DIGIT.sub('', value))
+            elif need_rating and not rating:
+                rating = float(value)
+            
+            if price_priority == 0 and (rating or not need_rating) and (reviews or not need_reviews):
+                break
+        
+        # Fall back to the looser patterns for anything the labelled forms missed
+        if need_price and price_str == "0":
+            price_str = self._extract_price_from_text(text)
+        if need_rating and not rating:
+            rating = self._extract_bare_rating(text)
+        
+        return price_str, rating, reviews
     
     def _extract_price_from_text(self, text: str) -> str:
         """Extract price from text using regex patterns"""
-        if not text:
+        # Most snippets and titles have no price, so skip the regexes when there is no currency marker
+        if not text or not _has_currency_marker(text):
             return "0"
         
-        import re
-        # Look for price patterns in the text
-        patterns = [
-            r'[₹$€£]\s*\d+(?:,\d+)+(?:\.\d+)?',  # ₹ 60,000.00 or $ 1,299.99 (requires comma)
-            r'[₹$€£]\d+(?:,\d+)+(?:\.\d+)?',     # ₹60,000.00 or $1,299.99 (requires comma)
-            r'INR\s*\d+(?:,\d+)+(?:\.\d+)?',     # INR 60,000.00 (requires comma)
-            r'Rs\.\s*\d+(?:,\d+)+(?:\.\d+)?',    # Rs. 60,000.00 (requires comma)
-        ]
-        
-        # Try patterns that require commas (more likely to be actual prices)
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Return the first match that looks like a reasonable product price
-                for match in matches:
-                    price_value = self._extract_price(match)
-                    if price_value >= 1000:  # Lower threshold for more products
-                        return match
-        
-        # If no comma-based prices found, try simpler patterns but be more selective
-        simple_patterns = [
-            r'[₹$€£]\s*\d{5,}(?:\.\d+)?',       # ₹ followed by 5+ digits
-            r'[₹$€£]\d{5,}(?:\.\d+)?',          # ₹ followed by 5+ digits
-        ]
-        
-        for pattern in simple_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Return the first match that looks like a reasonable product price
-                for match in matches:
-                    price_value = self._extract_price(match)
-                    if price_value >= 1000:  # Lower threshold for more products
-                        return match
+        # Try prices with commas first, then the simpler pattern
+        for pattern in (*_PRICE_PATTERNS, _SIMPLE_PRICE_RE):
+            # Return the first match that looks like a reasonable product price
+            for match in pattern.finditer(text):
+                price_value = self._extract_price(match.group())
+                if price_value >= 1000:  # Lower threshold for more products
+                    return match.group()
         
         return "0"
     
-    def _extract_rating_from_text(self, text: str) -> float:
-        """Extract rating from text using regex patterns"""
-        if not text:
-            return 0.0
-        
-        import re
-        # Look for rating patterns like "4.5" or "4.5 stars" or "4.5★"
-        patterns = [
-            r'(\d+\.\d+)\s*(?:stars?|★|rating|out of 5)',
-            r'(\d+\.\d+)\s*out of 5',
-            r'Rating:\s*(\d+\.\d+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                try:
-                    return float(matches[0])
-                except:
-                    pass
-        
-        # Try simple pattern for just decimal numbers
-        simple_matches = re.findall(r'\b(\d+\.\d+)\b', text)
-        for match in simple_matches:
-            try:
-                rating = float(match)
-                if 1 <= rating <= 5:  # Valid rating range
-                    return rating
-            except:
-                pass
+    def _extract_bare_rating(self, text: str) -> float:
+        """Extract the first decimal number in the valid rating range from text"""
+        # Stop at the first decimal in the valid rating range instead of collecting every match
+        for match in _DECIMAL_NUMBER.finditer(text):
+            rating = float(match.group(1))
+            if 1 <= rating <= 5:  # Valid rating range
+                return rating
         
         return 0.0
     
-    def _extract_reviews_from_text(self, text: str) -> int:
-        """Extract number of reviews from text using regex patterns"""
-        if not text:
-            return 0
-        
-        import re
-        # Look for review count patterns
-        patterns = [
-            r'(\d+(?:,\d+)*)\s*(?:reviews?|ratings?)',
-            r'\((\d+(?:,\d+)*)\s*(?:reviews?|ratings?)\)',
-            r'(\d+(?:,\d+)*)\s*reviews?',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                try:
-                    # Remove commas and convert to integer
-                    reviews_str = re.sub(r'[^\d]', '', matches[0])
-                    return int(reviews_str)
-                except:
-                    pass
-        
-        return 0
-    
     def _extract_price(self, price_str: str) -> float:
         """Extract numeric price from string"""
         if not price_str:
@@ -200,7 +340,7 @@ class EcomProductComparator:
             
         # Remove currency symbols and other non-numeric characters except decimal point
         # Handle various currency formats (₹, $, €, etc.) and comma separators
-        price_str = re.sub(r'[^\d.,]', '', price_str)
+        price_str = price_str.translate(_PRICE_CHARS)
         
         # Handle cases like "60,000" or "60.000" (comma as thousand separator)
         # We'll assume the last dot or comma is the decimal separator
@@ -211,7 +351,7 @@ class EcomProductComparator:
                 price_str = price_str.replace(',', '')
             else:
                 # Comma is decimal separator, replace with dot
-                price_str = price_str.replace(',', 'TEMP').replace('.', '').replace('TEMP', '.')
+                price_str = price_str.translate(_COMMA_DECIMAL_TABLE)
         elif ',' in price_str:
             # Only comma present, check if it's likely a decimal separator
             parts = price_str.split(',')
@@ -236,32 +376,25 @@ class EcomProductComparator:
         
         # Load configuration to get sites
         try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
+            with open("config.json", "rb") as f:
+                config = orjson.loads(f.read())
                 sites = config.get("sites", ["amazon.in", "flipkart.com", "reliancedigital.in", "snapdeal.com"])
         except FileNotFoundError:
             sites = ["amazon.in", "flipkart.com", "reliancedigital.in", "snapdeal.com"]
         
-        # Fetch products from all sites
-        all_products = []
-        for site in sites:
-            products = self.fetch_products(query, site, num_products)
-            all_products.extend(products)
+        # Fetch products from all sites concurrently
+        with ThreadPoolExecutor(max_workers=len(sites) or 1) as executor:
+            results = executor.map(lambda site: self.fetch_products(query, site, num_products), sites)
         
-        # Process products
+        # Process products, using the site each one was fetched from
         processed_products = []
-        for product in all_products:
-            # Determine site from link
-            link = product.get("link", "")
-            site_name = "Unknown"
-            for s in sites:
-                if s in link:
-                    site_name = s.split(".")[0].title()
-                    break
-            processed_products.append(self.extract_product_info(product, site_name))
+        for site, products in zip(sites, results):
+            site_name = self.sites.get(site, site)
+            for product in products:
+                processed_products.append(self.extract_product_info(product, site_name))
         
         # Create DataFrame
-        df = pd.DataFrame(processed_products)
+        df = self._build_dataframe(processed_products)
         
         if df.empty:
             print("No products found!")
@@ -272,56 +405,64 @@ class EcomProductComparator:
         
         return df
     
+    def _build_dataframe(self, products: List[ProductInfo]) -> pd.DataFrame:
+        """Build the comparison DataFrame column by column from extracted product info"""
+        if not products:
+            return pd.DataFrame()
+        
+        # Transpose the records into columns in one pass
+        columns = dict(zip(ProductInfo._fields, zip(*products)))
+        
+        # Give pandas typed numeric columns up front instead of inferring them row by row
+        columns["price"] = np.array(columns["price"], dtype=np.float64)
+        columns["rating"] = pd.to_numeric(columns["rating"], errors='coerce')
+        columns["reviews"] = pd.to_numeric(columns["reviews"], errors='coerce')
+        return pd.DataFrame(columns)
+    
     def _normalize_and_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """Normalize features and calculate scores"""
-        # Handle missing values
-        df["rating"] = pd.to_numeric(df["rating"], errors='coerce').fillna(0)
-        df["reviews"] = pd.to_numeric(df["reviews"], errors='coerce').fillna(0)
-        df["price"] = pd.to_numeric(df["price"], errors='coerce').fillna(0)
-        
-        # Filter out products with zero prices for scoring
-        df_filtered = df[df['price'] > 0].copy()
-        
-        if len(df_filtered) > 1:
+        # Handle missing values in all numeric columns in one pass
+        rating, reviews, price = np.nan_to_num(np.vstack([
+            pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+            for column in ("rating", "reviews", "price")
+        ]), nan=0.0)
+        df["rating"] = rating
+        df["reviews"] = reviews.astype(np.int64)
+        df["price"] = price
+        
+        # Only products with a valid price are scored, the rest get neutral scores
+        valid = price > 0
+        num_valid = np.count_nonzero(valid)
+        
+        if num_valid > 1:
             # Normalize price (lower is better)
-            max_price = df_filtered["price"].max()
-            df_filtered["price_score"] = (max_price - df_filtered["price"]) / max_price if max_price > 0 else 0
+            max_price = price[valid].max()
+            price_score = np.where(valid, (max_price - price) / max_price, 0.5)
             
             # Normalize rating (higher is better)
-            df_filtered["rating_score"] = df_filtered["rating"] / 5.0
+            rating_score = np.where(valid, rating / 5.0, 0.5)
             
             # Normalize reviews (higher is better)
-            max_reviews = df_filtered["reviews"].max()
-            df_filtered["review_score"] = df_filtered["reviews"] / max_reviews if max_reviews > 0 else 0
+            max_reviews = reviews[valid].max()
+            review_score = np.where(valid, reviews / max_reviews if max_reviews > 0 else 0.0, 0.5)
             
             # Calculate final weighted score
             # Weights: Price (40%), Features/Rating (40%), Reviews (20%)
-            df_filtered["final_score"] = (
-                0.4 * df_filtered["price_score"] + 
-                0.4 * df_filtered["rating_score"] + 
-                0.2 * df_filtered["review_score"]
-            )
-            
-            # Update the original dataframe with scores
-            df.loc[df_filtered.index, df_filtered.columns] = df_filtered
-        elif len(df_filtered) == 1:
+            final_score = np.where(valid, 0.4 * price_score + 0.4 * rating_score + 0.2 * review_score, 0.5)
+        elif num_valid == 1:
             # If only one product with valid price, give it a perfect score
-            df.loc[df_filtered.index, "final_score"] = 1.0
-            df.loc[df_filtered.index, "price_score"] = 1.0
-            df.loc[df_filtered.index, "rating_score"] = df_filtered["rating"].iloc[0] / 5.0
-            df.loc[df_filtered.index, "review_score"] = 1.0 if df_filtered["reviews"].iloc[0] > 0 else 0.0
+            price_score = np.where(valid, 1.0, 0.5)
+            rating_score = np.where(valid, rating / 5.0, 0.5)
+            review_score = np.where(valid, (reviews > 0).astype(np.float64), 0.5)
+            final_score = np.where(valid, 1.0, 0.5)
         else:
             # If no products with valid prices, give all products equal scores
-            df["final_score"] = 0.5
-            df["price_score"] = 0.5
-            df["rating_score"] = 0.5
-            df["review_score"] = 0.5
+            price_score = rating_score = review_score = final_score = np.full(len(df), 0.5)
         
-        # Handle NaN values in scores
-        df["final_score"] = df["final_score"].fillna(0.5)
-        df["price_score"] = df["price_score"].fillna(0.5)
-        df["rating_score"] = df["rating_score"].fillna(0.5)
-        df["review_score"] = df["review_score"].fillna(0.5)
+        df["price_score"] = price_score
+        df["rating_score"] = rating_score
+        df["review_score"] = review_score
+        df["final_score"] = final_score
         
         return df
     
@@ -330,19 +471,19 @@ class EcomProductComparator:
         if df.empty:
             return {}
             
-        # Get product with highest score
-        best_product = df.loc[df["final_score"].idxmax()]
+        # Get position of product with highest score
+        best = int(df["final_score"].to_numpy().argmax())
         
         return {
-            "name": best_product["name"],
-            "site": best_product["site"],
-            "price": best_product["price"],
-            "raw_price": best_product["raw_price"],
-            "rating": best_product["rating"],
-            "reviews": best_product["reviews"],
-            "link": best_product["link"],
-            "score": best_product["final_score"],
-            "image_url": best_product["image_url"]
+            "name": df["name"].iat[best],
+            "site": df["site"].iat[best],
+            "price": df["price"].iat[best],
+            "raw_price": df["raw_price"].iat[best],
+            "rating": df["rating"].iat[best],
+            "reviews": df["reviews"].iat[best],
+            "link": df["link"].iat[best],
+            "score": df["final_score"].iat[best],
+            "image_url": df["image_url"].iat[best]
         }
     
     def display_comparison(self, df: pd.DataFrame):
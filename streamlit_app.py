@@ -4,9 +4,8 @@ Streamlit frontend for E-Commerce Product Comparator
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import time
 import json
+import io
 from enhanced_comparator import EnhancedEcomComparator
 from main import EcomProductComparator
 
@@ -38,6 +37,11 @@ st.markdown("""
         margin: 1rem 0;
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
     }
+    .cards-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
+        gap: 1rem;
+    }
     .best-product {
         border: 2px solid #4CAF50;
         background-color: #f8fff8;
@@ -75,6 +79,34 @@ def load_config():
         st.error("Config file not found. Please make sure config.json exists.")
         return None
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_compare_products(comparison_mode, serpapi_key, query, num_products):
+    """Run a comparison, caching the results sorted by final score for an hour per query"""
+    if comparison_mode == "Enhanced (with images)":
+        comparator = EnhancedEcomComparator(serpapi_key)
+    else:
+        comparator = EcomProductComparator(serpapi_key)
+    df = comparator.compare_products(query, num_products)
+    if df.empty:
+        return df
+    return df.sort_values("final_score", ascending=False, ignore_index=True)
+
+@st.cache_data(show_spinner=False)
+def render_bar_chart(sites, values, colors, ylabel, label_fmt):
+    """Render a bar chart to PNG bytes, cached so reruns skip matplotlib entirely"""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    bars = ax.bar(sites, values, color=colors)
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis='x', rotation=45)
+    
+    # Add value labels on bars
+    ax.bar_label(bars, fmt=label_fmt, padding=3)
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
 def create_visualizations(df, query):
     """Create visualizations for the comparison"""
     if df.empty:
@@ -84,81 +116,29 @@ def create_visualizations(df, query):
     # Create tabs for different visualizations
     tab1, tab2, tab3, tab4 = st.tabs(["Price Comparison", "Rating Comparison", "Review Comparison", "Final Score Comparison"])
     
+    # Average every charted metric per site in a single groupby
+    site_means = df.groupby('site')[['price', 'rating', 'reviews', 'final_score']].mean()
+    sites = tuple(site_means.index)
+    
     with tab1:
         st.subheader("Average Price by Site")
-        fig1, ax1 = plt.subplots(figsize=(8, 6))
-        price_data = df.groupby('site')['price'].mean()
-        bars1 = ax1.bar(price_data.index, price_data.values, color=['#FF6B6B', '#4ECDC4', '#8b5cf6', '#f59e0b'])
-        ax1.set_ylabel('Price (₹)')
-        ax1.tick_params(axis='x', rotation=45)
-        
-        # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.annotate(f'₹{height:,.0f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom')
-        
-        st.pyplot(fig1)
+        st.image(render_bar_chart(sites, tuple(site_means['price']), ('#FF6B6B', '#4ECDC4', '#8b5cf6', '#f59e0b'),
+                                  'Price (₹)', '₹{:,.0f}'), width='stretch')
     
     with tab2:
         st.subheader("Average Rating by Site")
-        fig2, ax2 = plt.subplots(figsize=(8, 6))
-        rating_data = df.groupby('site')['rating'].mean()
-        bars2 = ax2.bar(rating_data.index, rating_data.values, color=['#45B7D1', '#96CEB4', '#8b5cf6', '#f59e0b'])
-        ax2.set_ylabel('Rating (out of 5)')
-        ax2.tick_params(axis='x', rotation=45)
-        
-        # Add value labels on bars
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.annotate(f'{height:.2f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom')
-        
-        st.pyplot(fig2)
+        st.image(render_bar_chart(sites, tuple(site_means['rating']), ('#45B7D1', '#96CEB4', '#8b5cf6', '#f59e0b'),
+                                  'Rating (out of 5)', '{:.2f}'), width='stretch')
     
     with tab3:
         st.subheader("Average Review Count by Site")
-        fig3, ax3 = plt.subplots(figsize=(8, 6))
-        review_data = df.groupby('site')['reviews'].mean()
-        bars3 = ax3.bar(review_data.index, review_data.values, color=['#FFEAA7', '#DDA0DD', '#8b5cf6', '#f59e0b'])
-        ax3.set_ylabel('Number of Reviews')
-        ax3.tick_params(axis='x', rotation=45)
-        
-        # Add value labels on bars
-        for bar in bars3:
-            height = bar.get_height()
-            ax3.annotate(f'{height:,.0f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom')
-        
-        st.pyplot(fig3)
+        st.image(render_bar_chart(sites, tuple(site_means['reviews']), ('#FFEAA7', '#DDA0DD', '#8b5cf6', '#f59e0b'),
+                                  'Number of Reviews', '{:,.0f}'), width='stretch')
     
     with tab4:
         st.subheader("Average Final Score by Site")
-        fig4, ax4 = plt.subplots(figsize=(8, 6))
-        score_data = df.groupby('site')['final_score'].mean()
-        bars4 = ax4.bar(score_data.index, score_data.values, color=['#A29BFE', '#FD79A8', '#8b5cf6', '#f59e0b'])
-        ax4.set_ylabel('Score (0-1)')
-        ax4.tick_params(axis='x', rotation=45)
-        
-        # Add value labels on bars
-        for bar in bars4:
-            height = bar.get_height()
-            ax4.annotate(f'{height:.2f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom')
-        
-        st.pyplot(fig4)
+        st.image(render_bar_chart(sites, tuple(site_means['final_score']), ('#A29BFE', '#FD79A8', '#8b5cf6', '#f59e0b'),
+                                  'Score (0-1)', '{:.2f}'), width='stretch')
 
 def display_product_comparison(df):
     """Display product comparison table"""
@@ -169,12 +149,13 @@ def display_product_comparison(df):
     # Sort by final score
     df_sorted = df.sort_values("final_score", ascending=False)
     
-    # Display key columns
+    # Display key columns under readable headers
     display_df = df_sorted[[
         "name", "site", "raw_price", "rating", "reviews", "final_score"
-    ]].copy()
-    
-    display_df.columns = ["Product", "Site", "Price", "Rating", "Reviews", "Final Score"]
+    ]].rename(columns={
+        "name": "Product", "site": "Site", "raw_price": "Price",
+        "rating": "Rating", "reviews": "Reviews", "final_score": "Final Score"
+    })
     
     st.subheader("Product Comparison")
     st.dataframe(display_df, width='stretch')
@@ -215,31 +196,31 @@ def display_product_cards(df):
     # Sort by final score
     df_sorted = df.sort_values("final_score", ascending=False)
     
-    # Create columns for product cards
-    cols = st.columns(min(len(df_sorted), 4))
+    # Build every card up front and send them to the page in a single markdown call
+    cards = []
+    for idx, row in enumerate(df_sorted.to_dict("records")):
+        is_best = idx == 0  # First product is the best
+        card_class = "product-card best-product" if is_best else "product-card"
+        
+        # Check if image URL is available
+        image_html = ""
+        if row.get('image_url'):
+            image_html = f"<img src='{row['image_url']}' class='product-image' alt='Product Image'>"
+        
+        cards.append(
+            f"<div class='{card_class}'>"
+            f"{image_html}"
+            f"<h4>{row['name']}</h4>"
+            f"<p><strong>Site:</strong> {row['site']}</p>"
+            f"<p><strong>Price:</strong> {row['raw_price']}</p>"
+            f"<p><strong>Rating:</strong> {row['rating']} ⭐</p>"
+            f"<p><strong>Reviews:</strong> {row['reviews']:,}</p>"
+            f"<p><strong>Score:</strong> {row['final_score']:.3f}</p>"
+            f"<a href='{row['link']}' target='_blank' style='background-color: #2196F3; color: white; padding: 8px 16px; text-decoration: none; border-radius: 5px; display: inline-block; margin-top: 10px;'>View on {row['site']}</a>"
+            "</div>"
+        )
     
-    for idx, (i, row) in enumerate(df_sorted.iterrows()):
-        with cols[idx % 4]:
-            is_best = idx == 0  # First product is the best
-            card_class = "product-card best-product" if is_best else "product-card"
-            
-            # Check if image URL is available
-            image_html = ""
-            if row.get('image_url'):
-                image_html = f"<img src='{row['image_url']}' class='product-image' alt='Product Image'>"
-            
-            st.markdown(f"""
-            <div class="{card_class}">
-                {image_html}
-                <h4>{row['name']}</h4>
-                <p><strong>Site:</strong> {row['site']}</p>
-                <p><strong>Price:</strong> {row['raw_price']}</p>
-                <p><strong>Rating:</strong> {row['rating']} ⭐</p>
-                <p><strong>Reviews:</strong> {row['reviews']:,}</p>
-                <p><strong>Score:</strong> {row['final_score']:.3f}</p>
-                <a href="{row['link']}" target="_blank" style="background-color: #2196F3; color: white; padding: 8px 16px; text-decoration: none; border-radius: 5px; display: inline-block; margin-top: 10px;">View on {row['site']}</a>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(f"<div class='cards-grid'>{''.join(cards)}</div>", unsafe_allow_html=True)
 
 def main():
     st.markdown("<h1 class='main-header'>🛒 E-Commerce Product Comparator</h1>", unsafe_allow_html=True)
@@ -310,15 +291,10 @@ def main():
         
         with st.spinner(f"Searching for '{product_query}' on e-commerce sites..."):
             try:
-                # Initialize comparator based on selected mode
-                if comparison_mode == "Enhanced (with images)":
-                    serpapi_key = config["serpapi_key"]
-                    comparator = EnhancedEcomComparator(serpapi_key)
-                    df = comparator.compare_products(product_query, num_products)
-                else:
-                    serpapi_key = config["serpapi_key"]
-                    comparator = EcomProductComparator(serpapi_key)
-                    df = comparator.compare_products(product_query, num_products)
+                serpapi_key = config["serpapi_key"]
+                
+                # Repeat searches are served from the cache instead of SerpAPI
+                df = cached_compare_products(comparison_mode, serpapi_key, product_query, num_products)
                 
                 if df.empty:
                     st.warning("No products found for your search. Try a different product name.")
@@ -355,8 +331,19 @@ def main():
                 # Display product cards
                 display_product_cards(df)
                 
-                # Get and display recommendation
-                recommendation = comparator.get_recommendation(df)
+                # The cached frame is sorted, so the best product is simply its first row
+                best = df.iloc[0]
+                recommendation = {
+                    "name": best["name"],
+                    "site": best["site"],
+                    "price": best["price"],
+                    "raw_price": best["raw_price"],
+                    "rating": best["rating"],
+                    "reviews": best["reviews"],
+                    "link": best["link"],
+                    "score": best["final_score"],
+                    "image_url": best.get("image_url", "")
+                }
                 display_recommendation(recommendation)
                 
                 # Create visualizations if requested
@@ -3,12 +3,14 @@ Streamlit frontend for E-Commerce Product Comparator using Bootstrap
 """
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from main import EcomProductComparator
+import numpy as np
 import json
+import os
+from jinja2 import Template
+from concurrent.futures import ThreadPoolExecutor
 
-# Load configuration
+# Load configuration once instead of re-reading config.json on every rerun
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_config():
     try:
         with open("config.json", "r") as f:
@@ -33,65 +35,34 @@ st.set_page_config(
     layout="wide"
 )
 
+# The app's own styles, read once at import instead of on every rerun
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "bootstrap_app.css"), "r") as f:
+    APP_CSS = f.read()
+
 # Add Bootstrap CSS
-st.markdown("""
+st.markdown(f"""
 <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
 <style>
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem 0;
-        margin-bottom: 2rem;
-        border-radius: 10px;
-    }
-    .product-card {
-        transition: transform 0.2s;
-        margin-bottom: 1rem;
-        height: 100%;
-    }
-    .product-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    .best-product {
-        border: 3px solid #28a745;
-        background-color: #f8fff8;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 10px;
-        padding: 1rem;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .recommendation-box {
-        background-color: #d4edda;
-        border-left: 5px solid #28a745;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border-radius: 0 10px 10px 0;
-    }
-    .btn-buy {
-        background-color: #28a745;
-        border-color: #28a745;
-    }
-    .btn-buy:hover {
-        background-color: #218838;
-        border-color: #1e7e34;
-    }
-    .feature-icon {
-        font-size: 2rem;
-        margin-bottom: 1rem;
-    }
-    .comparison-table {
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        border-radius: 10px;
-        overflow: hidden;
-    }
+{APP_CSS}
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_compare_products(serpapi_key, query, num_products):
+    """Run a comparison, caching the results for an hour per query"""
+    # Imported on first use so the welcome screen renders without loading the comparator
+    from main import EcomProductComparator
+    return EcomProductComparator(serpapi_key).compare_products(query, num_products)
+
+def create_bar_trace(sites, values, colors):
+    """Build a per-site bar trace directly from plotly graph objects"""
+    # Plotly is only needed once there are results to chart
+    import plotly.graph_objects as go
+    
+    # Cycle the palette over the bars like plotly express' color sequence does
+    bar_colors = [colors[i % len(colors)] for i in range(len(sites))]
+    return go.Bar(x=sites, y=values, marker_color=bar_colors)
+
 def create_visualizations(df, query):
     """Create visualizations for the comparison using Plotly"""
     if df.empty:
@@ -99,98 +70,70 @@ def create_visualizations(df, query):
         return
     
     # Filter out products with zero prices for visualization
-    df_viz = df[df['price'] > 0].copy()
-    if df_viz.empty:
+    valid_price = df['price'] > 0
+    if not valid_price.any():
         st.warning("No valid price data available for visualization!")
         return
     
-    # Create tabs for different visualizations
-    tab1, tab2, tab3, tab4 = st.tabs(["Price Comparison", "Rating Comparison", "Review Comparison", "Final Score Comparison"])
-    
-    with tab1:
-        st.subheader("Average Price by Site")
-        price_data = df_viz.groupby('site')['price'].mean().reset_index()
-        if not price_data.empty:
-            fig1 = px.bar(price_data, 
-                          x='site', y='price', 
-                          color='site',
-                          labels={'price': 'Price (₹)', 'site': 'E-commerce Site'},
-                          color_discrete_sequence=['#FF6B6B', '#4ECDC4'])
-            fig1.update_layout(title=f"Average Price Comparison for '{query}'")
-            st.plotly_chart(fig1, width='stretch')
-        else:
-            st.warning("No price data available for visualization")
-    
-    with tab2:
-        st.subheader("Average Rating by Site")
-        rating_data = df.groupby('site')['rating'].mean().reset_index()
-        if not rating_data.empty:
-            fig2 = px.bar(rating_data, 
-                          x='site', y='rating', 
-                          color='site',
-                          labels={'rating': 'Rating (out of 5)', 'site': 'E-commerce Site'},
-                          color_discrete_sequence=['#45B7D1', '#96CEB4'])
-            fig2.update_layout(title=f"Average Rating Comparison for '{query}'")
-            st.plotly_chart(fig2, width='stretch')
-        else:
-            st.warning("No rating data available for visualization")
-    
-    with tab3:
-        st.subheader("Average Review Count by Site")
-        review_data = df.groupby('site')['reviews'].mean().reset_index()
-        if not review_data.empty:
-            fig3 = px.bar(review_data, 
-                          x='site', y='reviews', 
-                          color='site',
-                          labels={'reviews': 'Number of Reviews', 'site': 'E-commerce Site'},
-                          color_discrete_sequence=['#FFEAA7', '#DDA0DD'])
-            fig3.update_layout(title=f"Average Review Count Comparison for '{query}'")
-            st.plotly_chart(fig3, width='stretch')
-        else:
-            st.warning("No review data available for visualization")
-    
-    with tab4:
-        st.subheader("Average Final Score by Site")
-        # Filter for visualization to avoid zero scores
-        df_score_viz = df[df['final_score'] > 0].copy()
-        score_data = df_score_viz.groupby('site')['final_score'].mean().reset_index()
-        if not score_data.empty:
-            fig4 = px.bar(score_data, 
-                          x='site', y='final_score', 
-                          color='site',
-                          labels={'final_score': 'Score (0-1)', 'site': 'E-commerce Site'},
-                          color_discrete_sequence=['#A29BFE', '#FD79A8'])
-            fig4.update_layout(title=f"Average Final Score Comparison for '{query}'")
-            st.plotly_chart(fig4, width='stretch')
-        else:
-            st.warning("No score data available for visualization")
+    # Average every metric per site in a single groupby; zero prices and scores are
+    # masked out as NaN so the mean skips them without filtering the frame per chart
+    site_means = df.assign(
+        price=df['price'].where(valid_price),
+        final_score=df['final_score'].where(df['final_score'] > 0)
+    ).groupby('site', observed=True)[['price', 'rating', 'reviews', 'final_score']].mean().reset_index()
+    
+    # Draw all four metrics as panels of one figure instead of four separate charts
+    from plotly.subplots import make_subplots
+    fig = make_subplots(rows=2, cols=2, subplot_titles=(
+        "Average Price by Site", "Average Rating by Site",
+        "Average Review Count by Site", "Average Final Score by Site"
+    ))
+    panels = [
+        # (column, row, col, axis label, colors)
+        ('price', 1, 1, 'Price (₹)', ['#FF6B6B', '#4ECDC4']),
+        ('rating', 1, 2, 'Rating (out of 5)', ['#45B7D1', '#96CEB4']),
+        ('reviews', 2, 1, 'Number of Reviews', ['#FFEAA7', '#DDA0DD']),
+        ('final_score', 2, 2, 'Score (0-1)', ['#A29BFE', '#FD79A8']),
+    ]
+    for column, row, col, ylabel, colors in panels:
+        # Sites without any valid price or non-zero score are left out of that panel
+        data = site_means[['site', column]].dropna()
+        fig.add_trace(create_bar_trace(data['site'].to_numpy(), data[column].to_numpy(), colors), row=row, col=col)
+        fig.update_yaxes(title_text=ylabel, row=row, col=col)
+    fig.update_xaxes(title_text='E-commerce Site', row=2)
+    fig.update_layout(title=f"Site Comparison for '{query}'", showlegend=False, height=700)
+    
+    if site_means['final_score'].isna().all():
+        st.warning("No score data available for visualization")
+    st.plotly_chart(fig, width='stretch', key="site_charts")
+
+def highlight_best(s):
+    """Highlight the best final score"""
+    scores = s.to_numpy()
+    return np.where(scores == scores.max(), 'background-color: #d4edda', '')
+
+def build_comparison_table(df):
+    """Relabel the key columns for the comparison table"""
+    # Display key columns under readable headers
+    return df[[
+        "name", "site", "raw_price", "rating", "reviews", "final_score"
+    ]].rename(columns={
+        "name": "Product", "site": "Site", "raw_price": "Price",
+        "rating": "Rating", "reviews": "Reviews", "final_score": "Final Score"
+    })
 
 def display_product_comparison(df):
-    """Display product comparison table"""
+    """Display product comparison table for products already sorted by final score"""
     if df.empty:
         st.warning("No products to display!")
         return
     
-    # Sort by final score
-    df_sorted = df.sort_values("final_score", ascending=False)
-    
-    # Display key columns
-    display_df = df_sorted[[
-        "name", "site", "raw_price", "rating", "reviews", "final_score"
-    ]].copy()
-    
-    display_df.columns = ["Product", "Site", "Price", "Rating", "Reviews", "Final Score"]
+    display_df = build_comparison_table(df)
     
     st.subheader("Product Comparison")
     
-    # Style the dataframe
-    def highlight_best(s):
-        if s.name == "Final Score":
-            is_max = s == s.max()
-            return ['background-color: #d4edda' if v else '' for v in is_max]
-        return [''] * len(s)
-    
-    styled_df = display_df.style.apply(highlight_best, axis=0)
+    # Style only the score column, with one vectorized comparison
+    styled_df = display_df.style.apply(highlight_best, subset=["Final Score"])
     st.dataframe(styled_df, width='stretch', height=400)
 
 def display_recommendation(recommendation):
@@ -221,45 +164,164 @@ def display_recommendation(recommendation):
         </div>
         """, unsafe_allow_html=True)
 
+# Compiled once at import; emitted as one line so markdown never sees an indented code block
+CARD_GRID_TEMPLATE = Template(
+    "<div class='row row-cols-3 g-3'>"
+    "{% for row in rows %}"
+    "<div class='col'><div class='card product-card h-100{% if loop.index0 == best_idx %} best-product{% endif %}'>"
+    "<div class='card-body d-flex flex-column'>"
+    "<h5 class='card-title'>{{ row.name }}</h5>"
+    "<p class='card-text'><span class='badge bg-primary'>{{ row.site }}</span></p>"
+    "<p class='card-text'><strong>Price:</strong> {{ row.raw_price }}</p>"
+    "<p class='card-text'><strong>Rating:</strong> {{ row.rating }} ⭐</p>"
+    "<p class='card-text'><strong>Reviews:</strong> {{ '{:,}'.format(row.reviews) }}</p>"
+    "<p class='card-text'><strong>Score:</strong> {{ '%.3f'|format(row.final_score) }}</p>"
+    "<div class='mt-auto'><a href='{{ row.link }}' target='_blank' class='btn btn-primary w-100'>"
+    "🔗 View on {{ row.site }}</a></div>"
+    "</div></div></div>"
+    "{% endfor %}"
+    "</div>"
+)
+
 def display_product_cards(df):
-    """Display products as cards"""
+    """Display products, already sorted by final score, as cards"""
     if df.empty:
         return
     
     st.subheader("Product Details")
     
-    # Sort by final score
-    df_sorted = df.sort_values("final_score", ascending=False)
+    # Render the whole grid in one pass and let Bootstrap lay the cards out three per row,
+    # so it goes to the page in a single markdown call
+    best_idx = df['final_score'].to_numpy().argmax()
+    cards_html = CARD_GRID_TEMPLATE.render(rows=df.itertuples(index=False), best_idx=best_idx)
+    st.markdown(cards_html, unsafe_allow_html=True)
+
+def display_results(df, query, recommendation, show_visualizations):
+    """Display the results of a comparison"""
+    # Compute the metric values once, averaging the price over valid prices only
+    total_products = len(df)
+    prices = df['price'].to_numpy()
+    valid_price = prices > 0
+    avg_price = prices[valid_price].mean() if valid_price.any() else 0
+    avg_rating = df['rating'].mean()
+    total_reviews = int(df['reviews'].sum())
     
-    # Create rows of cards
-    for i in range(0, len(df_sorted), 3):
-        cols = st.columns(3)
-        for j in range(3):
-            if i + j < len(df_sorted):
-                row = df_sorted.iloc[i + j]
-                is_best = (i + j) == 0  # First product is the best
-                
-                with cols[j]:
-                    card_class = "card product-card h-100" + (" best-product" if is_best else "")
-                    st.markdown(f"""
-                    <div class="{card_class}">
-                        <div class="card-body d-flex flex-column">
-                            <h5 class="card-title">{row['name']}</h5>
-                            <p class="card-text">
-                                <span class="badge bg-primary">{row['site']}</span>
-                            </p>
-                            <p class="card-text"><strong>Price:</strong> {row['raw_price']}</p>
-                            <p class="card-text"><strong>Rating:</strong> {row['rating']} ⭐</p>
-                            <p class="card-text"><strong>Reviews:</strong> {row['reviews']:,}</p>
-                            <p class="card-text"><strong>Score:</strong> {row['final_score']:.3f}</p>
-                            <div class="mt-auto">
-                                <a href="{row['link']}" target="_blank" class="btn btn-primary w-100">
-                                    🔗 View on {row['site']}
-                                </a>
-                            </div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+    # Display results
+    st.success(f"Found {total_products} products for comparison!")
+    
+    # Display key metrics using Bootstrap cards
+    st.subheader("Key Metrics")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="feature-icon">📦</div>
+            <h3>{total_products}</h3>
+            <p>Total Products</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="feature-icon">💰</div>
+            <h3>₹{avg_price:,.0f}</h3>
+            <p>Average Price</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="feature-icon">⭐</div>
+            <h3>{avg_rating:.2f}</h3>
+            <p>Average Rating</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="feature-icon">👥</div>
+            <h3>{total_reviews:,}</h3>
+            <p>Total Reviews</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Display product comparison table
+    display_product_comparison(df)
+    
+    # Display product cards
+    display_product_cards(df)
+    
+    # Display recommendation
+    display_recommendation(recommendation)
+    
+    # Create visualizations if requested
+    if show_visualizations:
+        st.subheader("📊 Visualizations")
+        create_visualizations(df, query)
+
+@st.cache_data
+def load_sample_output():
+    """Build the example comparison shown on the welcome screen, handing each caller its own copy"""
+    sample_data = {
+        'name': ['Apple iPhone 16 (128GB) - Black', 'Apple iPhone 16 (128GB) - Black'],
+        'site': ['Amazon', 'Flipkart'],
+        'price': [60000, 60500],
+        'raw_price': ['₹60,000', '₹60,500'],
+        'rating': [4.5, 4.3],
+        'reviews': [1200, 800],
+        'final_score': [0.845, 0.812]
+    }
+    sample_recommendation = {
+        "name": "Apple iPhone 16 (128GB) - Black",
+        "site": "Amazon",
+        "price": 60000,
+        "raw_price": "₹60,000",
+        "rating": 4.5,
+        "reviews": 1200,
+        "link": "https://www.amazon.in",
+        "score": 0.845
+    }
+    return pd.DataFrame(sample_data), sample_recommendation
+
+def display_sample_output():
+    """Display the welcome message with an example of the comparison output"""
+    # Display welcome message and instructions
+    st.info("👈 Enter your product search parameters in the sidebar and click 'Compare Products' to begin!")
+    
+    # Display sample results
+    st.subheader("Example Output")
+    sample_df, sample_recommendation = load_sample_output()
+    display_product_comparison(sample_df)
+    display_recommendation(sample_recommendation)
+
+@st.fragment
+def search_parameters(config):
+    """Sidebar search inputs; editing them reruns only this fragment, not the results"""
+    st.header("🔍 Search Parameters")
+    
+    # Product search
+    st.text_input("Product Name", "iPhone 16", key="product_query",
+                  help="Enter the product you want to compare")
+    
+    # Number of products per site
+    st.slider("Number of products per site", 1, 10, 
+              config.get("default_num_products", 5), key="num_products",
+              help="Number of products to compare from each site")
+    
+    # Multi-product comparison option
+    st.subheader("Multi-Product Comparison")
+    multi_product_mode = st.checkbox("Compare multiple products", key="multi_product_mode",
+                                     help="Enable to compare different products across sites")
+    
+    if multi_product_mode:
+        st.info("Enter product names separated by commas (e.g., 'iPhone 16, Samsung Galaxy S24')")
+        st.text_area("Product Names (comma separated)", 
+                     "iPhone 16, Samsung Galaxy S24", key="product_list",
+                     help="Enter multiple products to compare")
 
 def main():
     # Load configuration
@@ -277,35 +339,14 @@ def main():
     
     # Create sidebar for inputs
     with st.sidebar:
-        st.header("🔍 Search Parameters")
-        
-        # Product search
-        product_query = st.text_input("Product Name", "iPhone 16", 
-                                    help="Enter the product you want to compare")
-        
-        # Number of products per site
-        num_products = st.slider("Number of products per site", 1, 10, 
-                                config.get("default_num_products", 5),
-                                help="Number of products to compare from each site")
-        
-        # Multi-product comparison option
-        st.subheader("Multi-Product Comparison")
-        multi_product_mode = st.checkbox("Compare multiple products", 
-                                       help="Enable to compare different products across sites")
-        
-        if multi_product_mode:
-            st.info("Enter product names separated by commas (e.g., 'iPhone 16, Samsung Galaxy S24')")
-            product_list = st.text_area("Product Names (comma separated)", 
-                                      "iPhone 16, Samsung Galaxy S24",
-                                      help="Enter multiple products to compare")
+        search_parameters(config)
         
-        # Visualization option
+        # These change the results shown, so they sit outside the fragment and rerun the app
         show_visualizations = st.checkbox("Show Visualizations", True,
-                                        help="Display charts and graphs for comparison")
+                                          help="Display charts and graphs for comparison")
         
         # Run comparison button
-        run_comparison = st.button("🔍 Compare Products", type="primary",
-                                  width='stretch')
+        run_comparison = st.button("🔍 Compare Products", type="primary", width='stretch')
         
         st.divider()
         
@@ -334,17 +375,24 @@ def main():
         </div>
         """, unsafe_allow_html=True)
     
+    # Read the inputs the sidebar fragment left in session state
+    product_query = st.session_state["product_query"]
+    num_products = st.session_state["num_products"]
+    multi_product_mode = st.session_state["multi_product_mode"]
+    product_list = st.session_state.get("product_list", "")
+    
     # Main content area
     if run_comparison:
         if not product_query.strip():
             st.error("Please enter a product name to compare!")
             return
         
+        # Forget the previous results so a failed search doesn't leave them on screen
+        st.session_state.pop("comparison", None)
+        
         with st.spinner(f"Searching for products on Amazon and Flipkart..."):
             try:
-                # Initialize comparator from main.py
                 serpapi_key = config["serpapi_key"]
-                comparator = EcomProductComparator(serpapi_key)
                 
                 if multi_product_mode:
                     # Multi-product comparison mode
@@ -353,132 +401,78 @@ def main():
                         st.error("Please enter at least one product name for comparison!")
                         return
                     
+                    # Search for the products in parallel, the lookups are independent and I/O-bound
+                    from main import MAX_PARALLEL_COMPARISONS
+                    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_COMPARISONS, len(products))) as executor:
+                        results = list(executor.map(
+                            lambda product: cached_compare_products(serpapi_key, product, num_products),
+                            products
+                        ))
+                    
                     all_results = []
-                    for product in products:
-                        with st.spinner(f"Searching for '{product}'..."):
-                            df = comparator.compare_products(product, num_products)
-                            if not df.empty:
-                                all_results.append(df)
-                            else:
-                                st.warning(f"No products found for '{product}'")
+                    for product, df in zip(products, results):
+                        if not df.empty:
+                            all_results.append(df)
+                        else:
+                            st.warning(f"No products found for '{product}'")
                     
                     if all_results:
-                        # Combine all results
+                        # Combine all results, they are sorted by final score below
                         df = pd.concat(all_results, ignore_index=True)
-                        # Re-sort by final score
-                        df = df.sort_values("final_score", ascending=False)
                     else:
                         st.error("No products found for any of the entered products!")
                         return
                 else:
-                    # Single product comparison mode
-                    df = comparator.compare_products(product_query, num_products)
+                    # Single product comparison mode, repeat searches are served from the cache
+                    df = cached_compare_products(serpapi_key, product_query, num_products)
                 
                 if df.empty:
                     st.warning("No products found for your search. Try a different product name.")
                     return
                 
                 # Filter out products with zero prices for scoring if we have products with valid prices
-                df_filtered = df[df['price'] > 0].copy()
-                if not df_filtered.empty and len(df_filtered) < len(df):
-                    st.info(f"Filtered out {len(df) - len(df_filtered)} products with invalid prices")
-                    df = df_filtered
-                
-                # Display results
-                st.success(f"Found {len(df)} products for comparison!")
-                
-                # Display key metrics using Bootstrap cards
-                st.subheader("Key Metrics")
-                col1, col2, col3, col4 = st.columns(4)
+                valid_price = df['price'].to_numpy() > 0
+                if valid_price.any() and not valid_price.all():
+                    st.info(f"Filtered out {len(df) - valid_price.sum()} products with invalid prices")
+                    df = df[valid_price]
                 
-                with col1:
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="feature-icon">📦</div>
-                        <h3>{len(df)}</h3>
-                        <p>Total Products</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Sort once here, every display expects products in final score order
+                df = df.sort_values("final_score", ascending=False, ignore_index=True)
                 
-                with col2:
-                    # Calculate average price excluding zero prices
-                    valid_prices = df[df['price'] > 0]['price']
-                    avg_price = valid_prices.mean() if not valid_prices.empty else 0
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="feature-icon">💰</div>
-                        <h3>₹{avg_price:,.0f}</h3>
-                        <p>Average Price</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Group and compare sites by integer category codes instead of hashing strings
+                df['site'] = df['site'].astype('category')
                 
-                with col3:
-                    avg_rating = df['rating'].mean()
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="feature-icon">⭐</div>
-                        <h3>{avg_rating:.2f}</h3>
-                        <p>Average Rating</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # The frame is sorted, so the best product is simply its first row
+                best = df.iloc[0]
+                recommendation = {
+                    "name": best["name"],
+                    "site": best["site"],
+                    "price": best["price"],
+                    "raw_price": best["raw_price"],
+                    "rating": best["rating"],
+                    "reviews": best["reviews"],
+                    "link": best["link"],
+                    "score": best["final_score"],
+                    "image_url": best["image_url"]
+                }
                 
-                with col4:
-                    total_reviews = df['reviews'].sum()
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="feature-icon">👥</div>
-                        <h3>{total_reviews:,}</h3>
-                        <p>Total Reviews</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Display product comparison table
-                display_product_comparison(df)
-                
-                # Display product cards
-                display_product_cards(df)
-                
-                # Get and display recommendation
-                recommendation = comparator.get_recommendation(df)
-                display_recommendation(recommendation)
-                
-                # Create visualizations if requested
-                if show_visualizations:
-                    st.subheader("📊 Visualizations")
-                    create_visualizations(df, product_query)
+                # Keep the results so later reruns can redraw them without searching again
+                st.session_state["comparison"] = {
+                    "df": df,
+                    "query": product_query,
+                    "recommendation": recommendation
+                }
                 
             except Exception as e:
                 st.error(f"An error occurred during comparison: {str(e)}")
                 st.info("Please check your internet connection and try again.")
+                return
+    
+    comparison = st.session_state.get("comparison")
+    if comparison:
+        display_results(comparison["df"], comparison["query"], comparison["recommendation"], show_visualizations)
     else:
-        # Display welcome message and instructions
-        st.info("👈 Enter your product search parameters in the sidebar and click 'Compare Products' to begin!")
-        
-        # Display sample results
-        st.subheader("Example Output")
-        sample_data = {
-            'name': ['Apple iPhone 16 (128GB) - Black', 'Apple iPhone 16 (128GB) - Black'],
-            'site': ['Amazon', 'Flipkart'],
-            'price': [60000, 60500],
-            'raw_price': ['₹60,000', '₹60,500'],
-            'rating': [4.5, 4.3],
-            'reviews': [1200, 800],
-            'final_score': [0.845, 0.812]
-        }
-        sample_df = pd.DataFrame(sample_data)
-        display_product_comparison(sample_df)
-        
-        sample_recommendation = {
-            "name": "Apple iPhone 16 (128GB) - Black",
-            "site": "Amazon",
-            "price": 60000,
-            "raw_price": "₹60,000",
-            "rating": 4.5,
-            "reviews": 1200,
-            "link": "https://www.amazon.in",
-            "score": 0.845
-        }
-        display_recommendation(sample_recommendation)
+        display_sample_output()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file